@@ -100,27 +100,54 @@ def handle_get_all_user_images(user, image_service):
         logger.error(f"Post fetch error: {str(e)}", exc_info=True)
         return create_response(500, {"error": "Failed to fetch images"})
     
-def handle_get_all_images(image_service):
-    """Handle image fetch"""
+def handle_get_all_images(image_service, admission=None, listing_cache=None):
+    """Handle image fetch, degrading to cached, truncated or 503 under load"""
     logger.info("Starting image fetch process")
+    route = "GET /images"
     try:
-        images = image_service.get_all_images()
+        if admission is None or admission.try_admit(route, admission.cost_of("GET", "/images")):
+            listing = image_service.get_all_images()
+            if not listing.success:
+                return create_response(500, {"error": "Failed to fetch images"})
+            if listing_cache is not None:
+                listing_cache.store(listing.images)
+            return _images_response(listing.images)
 
-        response = ImagePostResponse(images=[
-            ImageData(name=img.name, presigned_url=img.presigned_url) for img in images
-        ])
+        cached = listing_cache.get() if listing_cache is not None else None
+        if cached is not None:
+            admission.record_shed(f"{route} (cached)")
+            return _images_response(cached, {"X-Listing-Mode": "cached", "Age": str(listing_cache.age())})
+
+        if admission.try_admit(f"{route} (truncated)", Config.LISTING_TRUNCATED_COST):
+            listing = image_service.get_all_images(limit=Config.LISTING_TRUNCATED_LIMIT)
+            if not listing.success:
+                return create_response(500, {"error": "Failed to fetch images"})
+            return _images_response(listing.images, {"X-Listing-Mode": "truncated"}, truncated=listing.truncated)
+
+        # The truncated listing is the cheapest fallback, so that is what a retry needs
+        admission.record_shed(f"{route} (503)")
+        retry_after = admission.retry_after(Config.LISTING_TRUNCATED_COST)
+        return create_response(503, {"error": "Service busy, retry later"}, {"Retry-After": str(retry_after)})
 
-        return create_response(200, {
-            "images": [
-                {"name": img.name, "presigned_url": img.presigned_url}
-                for img in response.images
-            ]
-        })
-    
     except Exception as e:
         logger.error(f"Post fetch error: {str(e)}", exc_info=True)
         return create_response(500, {"error": "Failed to fetch images"})
 
+def _images_response(images, headers=None, truncated=False):
+    response = ImagePostResponse(images=[
+        ImageData(name=img.name, presigned_url=img.presigned_url) for img in images
+    ])
+
+    body = {
+        "images": [
+            {"name": img.name, "presigned_url": img.presigned_url}
+            for img in response.images
+        ]
+    }
+    if truncated:
+        body["truncated"] = True
+    return create_response(200, body, headers)
+
 def authenticate_user(headers, jwt_service):
     auth_header = headers.get('Authorization') or headers.get('authorization')
     if not auth_header:
@@ -134,16 +161,19 @@ def authenticate_user(headers, jwt_service):
 
     return user, None
 
-def create_response(status_code, body):
+def create_response(status_code, body, extra_headers=None):
     """Create standardized API Gateway response"""
     logger.debug(f"Creating response with status {status_code}")
+    headers = {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type, Authorization'
+    }
+    if extra_headers:
+        headers.update(extra_headers)
     return {
         'statusCode': status_code,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
-            'Access-Control-Allow-Headers': 'Content-Type, Authorization'
-        },
+        'headers': headers,
         'body': json.dumps(body)
     }
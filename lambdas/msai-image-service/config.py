@@ -10,6 +10,14 @@ class Config:
     MAX_FILE_SIZE = int(os.environ.get('MAX_FILE_SIZE', 10 * 1024 * 1024))
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*')
     ALLOWED_REGIONS = os.environ.get('ALLOWED_REGIONS', 'PT,US')
+
+    # Admission control (per warm container)
+    ADMISSION_CAPACITY = float(os.environ.get('ADMISSION_CAPACITY', 20))
+    ADMISSION_REFILL_RATE = float(os.environ.get('ADMISSION_REFILL_RATE', 2))
+    LISTING_FULL_COST = float(os.environ.get('LISTING_FULL_COST', 10))
+    LISTING_TRUNCATED_COST = float(os.environ.get('LISTING_TRUNCATED_COST', 2))
+    LISTING_TRUNCATED_LIMIT = int(os.environ.get('LISTING_TRUNCATED_LIMIT', 25))
+    LISTING_CACHE_MAX_AGE = int(os.environ.get('LISTING_CACHE_MAX_AGE', 300))
     
     @classmethod
     def get_content_type(cls, file_extension: str) -> str:
@@ -0,0 +1,122 @@
+import math
+import time
+import logging
+from typing import Callable, Optional
+from domain.models import ImageData
+from config import Config
+
+logger = logging.getLogger()
+logger.setLevel(logging.WARNING)
+
+# Cost charged against the token bucket for each (method, path) route.
+# Routes not listed here (uploads, deletes, per-user reads) are never
+# charged, so a listing storm cannot starve them.
+ROUTE_COSTS = {
+    ("GET", "/images"): Config.LISTING_FULL_COST,
+}
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate"""
+
+    def __init__(self, capacity: float, refill_rate: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.clock = clock
+        self.tokens = capacity
+        self.updated_at = clock()
+
+    def _refill(self):
+        now = self.clock()
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.updated_at = now
+
+    def try_acquire(self, cost: float) -> bool:
+        """Take `cost` tokens if available, without blocking"""
+        self._refill()
+        if cost <= self.tokens:
+            self.tokens -= cost
+            return True
+        return False
+
+    def available(self) -> float:
+        """Tokens available right now"""
+        self._refill()
+        return self.tokens
+
+    def seconds_until(self, cost: float) -> int:
+        """Whole seconds until `cost` tokens will be available"""
+        self._refill()
+        missing = min(cost, self.capacity) - self.tokens
+        if missing <= 0:
+            return 0
+        if self.refill_rate <= 0:
+            return 60
+        return max(1, math.ceil(missing / self.refill_rate))
+
+
+class ListingCache:
+    """Last full listing served by this container"""
+
+    def __init__(self, max_age: int, clock: Callable[[], float] = time.monotonic):
+        self.max_age = max_age
+        self.clock = clock
+        self.images: Optional[list[ImageData]] = None
+        self.stored_at = 0.0
+
+    def store(self, images: list[ImageData]):
+        self.images = images
+        self.stored_at = self.clock()
+
+    def get(self) -> Optional[list[ImageData]]:
+        """Return the cached listing if it is younger than max_age"""
+        if self.images is None or self.clock() - self.stored_at > self.max_age:
+            return None
+        return self.images
+
+    def age(self) -> int:
+        return int(self.clock() - self.stored_at)
+
+
+class AdmissionController:
+    """
+    Per-route cost accounting on top of a shared token bucket.
+
+    State lives for the lifetime of a warm Lambda container, so limits
+    apply per concurrent execution environment, not account-wide.
+    """
+
+    def __init__(self, bucket: Optional[TokenBucket] = None, route_costs: Optional[dict] = None):
+        self.bucket = bucket or TokenBucket(Config.ADMISSION_CAPACITY, Config.ADMISSION_REFILL_RATE)
+        self.route_costs = route_costs if route_costs is not None else ROUTE_COSTS
+        self.admitted: dict[str, int] = {}
+        self.shed: dict[str, int] = {}
+
+    def cost_of(self, method: str, path: str) -> float:
+        return self.route_costs.get((method, path), 0)
+
+    def try_admit(self, route: str, cost: float) -> bool:
+        """Charge `cost` for `route`; free routes are always admitted"""
+        if cost <= 0 or self.bucket.try_acquire(cost):
+            self.record_admit(route)
+            return True
+        return False
+
+    def record_admit(self, route: str):
+        self.admitted[route] = self.admitted.get(route, 0) + 1
+
+    def record_shed(self, route: str):
+        self.shed[route] = self.shed.get(route, 0) + 1
+        logger.warning(f"Load shed on {route}: {self.shed[route]} total")
+
+    def retry_after(self, cost: float) -> int:
+        return self.bucket.seconds_until(cost)
+
+    def stats(self) -> dict:
+        return {
+            "tokens": round(self.bucket.available(), 2),
+            "capacity": self.bucket.capacity,
+            "admitted": dict(self.admitted),
+            "shed": dict(self.shed),
+        }
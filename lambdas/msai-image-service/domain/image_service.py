@@ -1,6 +1,7 @@
 import base64
 import json
-from domain.models import ImageData, ImageUploadRequest, ImageUploadResponse, ImageDeleteRequest, ImageDeleteResponse, ImagePostRequest, ImagePostResponse
+from typing import Optional
+from domain.models import ImageData, ImageListResponse, ImageUploadRequest, ImageUploadResponse, ImageDeleteRequest, ImageDeleteResponse, ImagePostRequest, ImagePostResponse
 from repository.s3_repository import S3Repository
 import logging
 
@@ -103,10 +104,19 @@ class ImageService:
             logger.error(f"get_all_user_images: {str(e)}", exc_info=True)
             return []
         
-    def get_all_images(self) -> list[ImageData]:
+    def get_all_images(self, limit: Optional[int] = None) -> ImageListResponse:
+        """
+        Fetch images across all users from S3
+
+        Args:
+            limit: Optional cap on listed objects, used for degraded listings
+
+        Returns:
+            ImageListResponse object, success=False if S3 could not be listed
+        """
         try:
             logger.info("Fetching all images from S3")
-            objects = self.s3_repository.list_all_images()
+            objects, truncated = self.s3_repository.list_all_images(max_keys=limit)
             logger.info(f"Found {len(objects)} images in total")
 
             images = []
@@ -119,11 +129,11 @@ class ImageService:
                 if presigned_url:
                     images.append(ImageData(name=image_name, presigned_url=presigned_url))
 
-            return images
+            return ImageListResponse(success=True, images=images, truncated=truncated)
 
         except Exception as e:
             logger.error(f"get_all_images: {str(e)}", exc_info=True)
-            return []
+            return ImageListResponse(success=False, images=[])
         
     
     def parse_image_from_event(self, event: dict):
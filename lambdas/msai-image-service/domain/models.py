@@ -31,6 +31,13 @@ class ImagePostResponse:
     """Image post response model"""
     images: list[ImageData]
 
+@dataclass
+class ImageListResponse:
+    """Image listing response model"""
+    success: bool
+    images: list[ImageData]
+    truncated: bool = False
+
 @dataclass
 class ImageUploadResponse:
     """Image upload response model"""
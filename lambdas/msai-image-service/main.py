@@ -4,12 +4,17 @@ from application.handler import handle_get_all_user_images, handle_get_all_image
 from application.handler import create_response, authenticate_user
 from domain.jwt_service import JWTService
 from domain.image_service import ImageService
+from domain.admission_control import AdmissionController, ListingCache
 from repository.s3_repository import S3Repository
 from config import Config
 
 logger = logging.getLogger()
 logger.setLevel(logging.ERROR)
 
+# Module scope so budgets and cached listings survive warm invocations
+admission = AdmissionController()
+listing_cache = ListingCache(Config.LISTING_CACHE_MAX_AGE)
+
 def lambda_handler(event, context):
     logger.info("Lambda function invoked")
     logger.debug(f"Full event: {json.dumps(event)}")
@@ -35,7 +40,8 @@ def lambda_handler(event, context):
                     logger.info("Handling health check request")
                     return create_response(200, {
                         "status": "OK",
-                        "message": "Service is operational"
+                        "message": "Service is operational",
+                        "admission": admission.stats()
                     })
                 else:
                     return create_response(405, {"error": "Method not allowed"})
@@ -45,7 +51,7 @@ def lambda_handler(event, context):
                     if not header_region or header_region.upper() not in Config.ALLOWED_REGIONS.split(','):
                         return create_response(403, {"error": f"Region {header_region} not allowed"})
                     logger.info(f"Fetching all images from region: {header_region}")
-                    return handle_get_all_images(image_service)
+                    return handle_get_all_images(image_service, admission, listing_cache)
                 else:
                     return create_response(405, {"error": "Method not allowed"})
 
@@ -22,9 +22,12 @@ class S3Repository:
             print(f"Failed to list images: {str(e)}")
             return []
         
-    def list_all_images(self):
-        response = self.s3_client.list_objects_v2(Bucket=self.bucket_name)
-        return response.get('Contents', [])
+    def list_all_images(self, max_keys: Optional[int] = None) -> tuple[list[dict], bool]:
+        params = {'Bucket': self.bucket_name}
+        if max_keys:
+            params['MaxKeys'] = max_keys
+        response = self.s3_client.list_objects_v2(**params)
+        return response.get('Contents', []), response.get('IsTruncated', False)
         
     def get_presigned_url(self, s3_key: str, expires_in: int = 3600) -> str | None:
         try:
@@ -0,0 +1,159 @@
+import json
+import pytest
+from application.handler import handle_get_all_images
+from domain.admission_control import AdmissionController, ListingCache, TokenBucket
+from domain.models import ImageData, ImageListResponse
+from config import Config
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeImageService:
+    def __init__(self, success=True, truncated=False):
+        self.success = success
+        self.truncated = truncated
+        self.calls = []
+
+    def get_all_images(self, limit=None):
+        self.calls.append(limit)
+        if not self.success:
+            return ImageListResponse(success=False, images=[])
+        count = limit or 3
+        return ImageListResponse(
+            success=True,
+            images=[ImageData(name=f"{i}.jpg", presigned_url=f"url-{i}") for i in range(count)],
+            truncated=self.truncated
+        )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_admission(clock, tokens):
+    bucket = TokenBucket(capacity=20, refill_rate=2, clock=clock)
+    bucket.tokens = tokens
+    return AdmissionController(bucket)
+
+
+def test_token_bucket_refills_up_to_capacity(clock):
+    bucket = TokenBucket(capacity=10, refill_rate=2, clock=clock)
+    assert bucket.try_acquire(10)
+    assert not bucket.try_acquire(1)
+
+    clock.now = 2
+    assert bucket.available() == 4
+
+    clock.now = 100
+    assert bucket.available() == 10
+
+
+def test_token_bucket_seconds_until(clock):
+    bucket = TokenBucket(capacity=10, refill_rate=2, clock=clock)
+    assert bucket.seconds_until(5) == 0
+
+    bucket.try_acquire(10)
+    assert bucket.seconds_until(2) == 1
+    assert bucket.seconds_until(5) == 3
+    assert bucket.seconds_until(50) == 5
+
+
+def test_stats_reports_refilled_tokens(clock):
+    admission = make_admission(clock, tokens=0)
+    clock.now = 60
+    assert admission.stats()["tokens"] == 20
+
+
+def test_listing_cache_expires(clock):
+    cache = ListingCache(max_age=300, clock=clock)
+    assert cache.get() is None
+
+    images = [ImageData(name="a.jpg", presigned_url="url")]
+    cache.store(images)
+    clock.now = 300
+    assert cache.get() == images
+    assert cache.age() == 300
+
+    clock.now = 301
+    assert cache.get() is None
+
+
+def test_full_listing_when_admitted(clock):
+    admission = make_admission(clock, tokens=20)
+    cache = ListingCache(max_age=300, clock=clock)
+    service = FakeImageService()
+
+    response = handle_get_all_images(service, admission, cache)
+
+    assert response['statusCode'] == 200
+    assert 'X-Listing-Mode' not in response['headers']
+    assert len(json.loads(response['body'])['images']) == 3
+    assert service.calls == [None]
+    assert cache.get() is not None
+    assert admission.stats()["admitted"] == {"GET /images": 1}
+
+
+def test_serves_cached_listing_under_pressure(clock):
+    admission = make_admission(clock, tokens=0)
+    cache = ListingCache(max_age=300, clock=clock)
+    cache.store([ImageData(name="a.jpg", presigned_url="url")])
+    service = FakeImageService()
+
+    response = handle_get_all_images(service, admission, cache)
+
+    assert response['statusCode'] == 200
+    assert response['headers']['X-Listing-Mode'] == "cached"
+    assert json.loads(response['body'])['images'] == [{"name": "a.jpg", "presigned_url": "url"}]
+    assert service.calls == []
+    assert admission.stats()["shed"] == {"GET /images (cached)": 1}
+
+
+@pytest.mark.parametrize("truncated", [True, False])
+def test_serves_truncated_listing_without_cache(clock, truncated):
+    admission = make_admission(clock, tokens=Config.LISTING_TRUNCATED_COST)
+    cache = ListingCache(max_age=300, clock=clock)
+    service = FakeImageService(truncated=truncated)
+
+    response = handle_get_all_images(service, admission, cache)
+    body = json.loads(response['body'])
+
+    assert response['statusCode'] == 200
+    assert response['headers']['X-Listing-Mode'] == "truncated"
+    assert body.get('truncated', False) is truncated
+    assert service.calls == [Config.LISTING_TRUNCATED_LIMIT]
+    assert cache.get() is None
+
+
+def test_sheds_with_retry_after_when_exhausted(clock):
+    admission = make_admission(clock, tokens=0)
+    cache = ListingCache(max_age=300, clock=clock)
+    service = FakeImageService()
+
+    response = handle_get_all_images(service, admission, cache)
+
+    assert response['statusCode'] == 503
+    expected = admission.bucket.seconds_until(Config.LISTING_TRUNCATED_COST)
+    assert response['headers']['Retry-After'] == str(expected)
+    assert service.calls == []
+    assert admission.stats()["shed"] == {"GET /images (503)": 1}
+
+
+def test_failed_listing_is_not_cached(clock):
+    admission = make_admission(clock, tokens=20)
+    cache = ListingCache(max_age=300, clock=clock)
+
+    response = handle_get_all_images(FakeImageService(success=False), admission, cache)
+
+    assert response['statusCode'] == 500
+    assert cache.get() is None
+
+    admission.bucket.tokens = 0
+    response = handle_get_all_images(FakeImageService(), admission, cache)
+    assert response['statusCode'] == 503
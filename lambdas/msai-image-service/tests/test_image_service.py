@@ -0,0 +1,51 @@
+import pytest
+
+boto3 = pytest.importorskip("boto3")
+moto = pytest.importorskip("moto")
+
+from domain.image_service import ImageService
+from repository.s3_repository import S3Repository
+
+BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def image_service(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_aws():
+        boto3.client("s3").create_bucket(Bucket=BUCKET)
+        yield ImageService(S3Repository(bucket_name=BUCKET))
+
+
+def put_images(service, count):
+    for i in range(count):
+        service.s3_repository.s3_client.put_object(Bucket=BUCKET, Key=f"user/{i}.jpg", Body=b"data")
+
+
+def test_get_all_images_reports_truncation(image_service):
+    put_images(image_service, 3)
+
+    listing = image_service.get_all_images(limit=2)
+
+    assert listing.success
+    assert listing.truncated
+    assert len(listing.images) == 2
+
+
+def test_get_all_images_complete_under_limit(image_service):
+    put_images(image_service, 3)
+
+    listing = image_service.get_all_images(limit=25)
+
+    assert listing.success
+    assert not listing.truncated
+    assert len(listing.images) == 3
+
+
+def test_get_all_images_flags_failure(image_service):
+    image_service.s3_repository.bucket_name = "missing-bucket"
+
+    listing = image_service.get_all_images()
+
+    assert not listing.success
+    assert listing.images == []